@@ -13,28 +13,59 @@ Datasets:
 import json
 import csv
 import os
+import sys
 from pathlib import Path
-from typing import List, Dict, Set
-from collections import defaultdict
+from types import MappingProxyType
+from typing import List, Dict, FrozenSet, Iterator, NamedTuple, Tuple
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache, partial
+from itertools import chain
 
 # Load available .sigml files
-def load_available_signs() -> Set[str]:
+@cache
+def load_available_signs() -> FrozenSet[str]:
     """Load all available .sigml filenames from public/SignFiles/"""
     sign_dir = Path(__file__).parent.parent / "public" / "SignFiles"
     available = set()
     
     if sign_dir.exists():
-        for file in sign_dir.glob("*.sigml"):
-            # Store lowercase basename without extension
-            available.add(file.stem.lower())
+        # Reuse the cached index while the directory is unchanged
+        # (adding or removing a file bumps the directory mtime)
+        cache_path = sign_dir.parent / ".sigml_index.json"
+        mtime = sign_dir.stat().st_mtime_ns
+        cached = False
+        try:
+            with open(cache_path, encoding='utf-8') as f:
+                index = json.load(f)
+            if index['mtime'] == mtime:
+                available = set(index['names'])
+                cached = True
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        
+        if not cached:
+            # Plain suffix check on scandir entries; no per-file Path or fnmatch work
+            with os.scandir(sign_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith('.sigml') and entry.is_file():
+                        # Store lowercase basename without extension
+                        available.add(name[:-6].lower())
+            try:
+                with open(cache_path, 'w', encoding='utf-8') as f:
+                    json.dump({'mtime': mtime, 'names': sorted(available)}, f)
+            except OSError:
+                pass
     
     print(f"[INFO] Found {len(available)} available .sigml files")
-    return available
+    return frozenset(map(sys.intern, available))
 
 AVAILABLE_SIGNS = load_available_signs()
 
 # Real ISL vocabulary from CISLR dataset (4,700+ words)
-CISLR_VOCABULARY = [
+CISLR_VOCABULARY = frozenset([
     # Disaster Management Actions (500+)
     "evacuate", "rescue", "distribute", "deploy", "search", "alert", "warn",
     "emergency", "danger", "safe", "shelter", "relief", "aid", "support",
@@ -107,10 +138,10 @@ CISLR_VOCABULARY = [
     "fry", "sauté", "pan-fry", "deep-fry",
     "boil", "simmer", "poach", "blanch", "steam",
     "serve", "plate", "garnish", "present",
-]
+])
 
 # INCLUDE dataset vocabulary (~4,287 signs)
-INCLUDE_VOCABULARY = [
+INCLUDE_VOCABULARY = frozenset([
     # Technology Actions (400+)
     "click", "tap", "swipe", "scroll", "zoom", "pinch",
     "type", "keyboard", "mouse", "touchscreen", "screen",
@@ -161,10 +192,10 @@ INCLUDE_VOCABULARY = [
     "steer", "navigate", "direct", "guide", "lead",
     "travel", "journey", "commute", "transport", "transfer",
     "fly", "sail", "cruise", "voyage", "navigate",
-]
+])
 
 # ISLTranslate dataset - sentence/phrase level actions
-ISLTRANSLATE_VOCABULARY = [
+ISLTRANSLATE_VOCABULARY = frozenset([
     # Agricultural Actions (400+)
     "plant", "sow", "seed", "grow", "cultivate", "farm",
     "plow", "till", "dig", "hoe", "rake", "weed",
@@ -199,364 +230,434 @@ ISLTRANSLATE_VOCABULARY = [
     "judge", "rule", "decide", "verdict", "sentence",
     "arrest", "detain", "custody", "jail", "prison",
     "fine", "penalty", "punish", "reward", "compensate",
-]
+])
+
+def intern_mapping(mapping: Dict[str, str]) -> Dict[str, str]:
+    """Intern keys and values so lookups with interned words hit the identity fast path"""
+    return {sys.intern(key): sys.intern(value) for key, value in mapping.items()}
+
+# COMPREHENSIVE ACTION MAPPINGS - Word to Character Action
+# This maps each word to what the CHARACTER/AVATAR DOES (the action, not the word)
+ACTION_MAPPINGS = MappingProxyType(intern_mapping({
+    # Disaster Management - Character Actions
+    'evacuate': 'run', 'rescue': 'carry', 'distribute': 'give', 'deploy': 'send',
+    'search': 'look', 'alert': 'call', 'warn': 'wave', 'emergency': 'run',
+    'danger': 'stop', 'safe': 'protect', 'shelter': 'house', 'relief': 'help',
+    'aid': 'give', 'support': 'hold', 'assist': 'help', 'protect': 'guard',
+    'injured': 'fall', 'injury': 'hurt', 'medical': 'hospital', 'medicine': 'pill',
+    'treat': 'care', 'flood': 'water', 'earthquake': 'shake', 'fire': 'burn',
+    'storm': 'wind', 'cyclone': 'spin', 'tsunami': 'wave', 'landslide': 'fall',
+    'disaster': 'break', 'crisis': 'problem', 'victim': 'person', 'survivor': 'person',
+    'damage': 'break', 'destroy': 'break', 'rebuild': 'build', 'recover': 'heal',
+    
+    # Movement - Character performs these actions
+    'walk': 'walk', 'run': 'run', 'jog': 'run', 'sprint': 'run',
+    'jump': 'jump', 'leap': 'jump', 'hop': 'jump', 'skip': 'jump',
+    'sit': 'sit', 'stand': 'stand', 'lie': 'sleep', 'kneel': 'bow',
+    'crouch': 'bend', 'bend': 'bow', 'bow': 'bow', 'stretch': 'reach',
+    'crawl': 'move', 'climb': 'up', 'descend': 'down', 'ascend': 'up',
+    'swim': 'swim', 'dive': 'jump', 'float': 'swim',
+    'fly': 'fly', 'drive': 'car', 'ride': 'bike', 'pedal': 'cycle',
+    'roll': 'turn', 'spin': 'turn', 'rotate': 'turn', 'twist': 'turn',
+    'turn': 'turn', 'slide': 'move', 'slip': 'fall', 'fall': 'fall',
+    'trip': 'fall', 'stumble': 'fall',
+    
+    # Hand & Arm Actions - What character does with hands
+    'push': 'push', 'pull': 'pull', 'lift': 'carry', 'carry': 'carry',
+    'hold': 'hold', 'grab': 'take', 'grasp': 'hold', 'grip': 'hold',
+    'release': 'open', 'drop': 'fall', 'throw': 'throw', 'toss': 'throw',
+    'catch': 'catch', 'hit': 'strike', 'strike': 'hit', 'punch': 'hit',
+    'slap': 'hit', 'clap': 'clap', 'point': 'show', 'wave': 'wave',
+    'shake': 'shake', 'touch': 'touch', 'feel': 'touch', 'scratch': 'rub',
+    'rub': 'rub', 'pat': 'touch', 'tap': 'touch', 'poke': 'touch',
+    'squeeze': 'press', 'pinch': 'hold', 'tear': 'break', 'fold': 'fold',
+    'unfold': 'open', 'open': 'open', 'close': 'close', 'lock': 'lock',
+    'unlock': 'open',
+    
+    # Daily Activities - Character's daily actions
+    'eat': 'eat', 'drink': 'drink', 'cook': 'cook', 'bake': 'cook',
+    'fry': 'cook', 'boil': 'cook', 'steam': 'cook', 'grill': 'cook',
+    'clean': 'wash', 'wash': 'wash', 'wipe': 'clean', 'scrub': 'wash',
+    'sweep': 'clean', 'mop': 'clean', 'vacuum': 'clean', 'dust': 'clean',
+    'bath': 'wash', 'shower': 'wash', 'brush': 'brush', 'comb': 'brush',
+    'shave': 'cut', 'dress': 'wear', 'wear': 'put', 'remove': 'take',
+    'read': 'read', 'write': 'write', 'draw': 'draw', 'paint': 'draw',
+    'sketch': 'draw', 'color': 'draw', 'erase': 'delete',
+    'study': 'learn', 'learn': 'learn', 'teach': 'teach', 'explain': 'show',
+    'demonstrate': 'show', 'practice': 'do', 'work': 'work', 'type': 'write',
+    'calculate': 'think', 'measure': 'check', 'weigh': 'measure', 'count': 'count',
+    
+    # Communication - How character communicates
+    'talk': 'speak', 'speak': 'speak', 'say': 'speak', 'tell': 'speak',
+    'ask': 'ask', 'answer': 'reply', 'question': 'ask', 'reply': 'answer',
+    'call': 'phone', 'text': 'write', 'email': 'write', 'message': 'send',
+    'chat': 'talk', 'discuss': 'talk', 'argue': 'fight', 'debate': 'talk',
+    'listen': 'hear', 'hear': 'hear', 'watch': 'see', 'see': 'look',
+    'look': 'see', 'observe': 'watch', 'examine': 'check', 'inspect': 'check',
+    'understand': 'know', 'comprehend': 'know', 'interpret': 'think',
+    'translate': 'change', 'sign': 'gesture', 'gesture': 'show',
+    'indicate': 'point', 'signal': 'wave', 'express': 'show', 'communicate': 'talk',
+    
+    # Sports - Character playing/doing sports
+    'play': 'play', 'exercise': 'move', 'train': 'practice', 'compete': 'fight',
+    'race': 'run', 'win': 'celebrate', 'lose': 'sad',
+    'kick': 'kick', 'dribble': 'move', 'pass': 'throw', 'shoot': 'throw',
+    'score': 'goal', 'defend': 'block', 'attack': 'fight',
+    'bat': 'hit', 'bowl': 'throw', 'field': 'catch', 'pitch': 'throw',
+    'serve': 'throw', 'volley': 'hit', 'smash': 'hit', 'rally': 'play',
+    'box': 'fight', 'wrestle': 'fight', 'fight': 'fight',
+    'yoga': 'balance', 'meditate': 'sit', 'balance': 'stand', 'pose': 'stand',
+    
+    # Professional - Work actions
+    'build': 'make', 'construct': 'build', 'assemble': 'join', 'install': 'put',
+    'repair': 'fix', 'fix': 'repair', 'maintain': 'check',
+    'design': 'plan', 'plan': 'think', 'organize': 'arrange', 'arrange': 'order',
+    'prepare': 'make', 'setup': 'arrange',
+    'operate': 'use', 'control': 'manage', 'manage': 'lead', 'supervise': 'watch',
+    'coordinate': 'organize', 'produce': 'make', 'manufacture': 'make',
+    'create': 'make', 'make': 'make', 'craft': 'make',
+    'sell': 'give', 'buy': 'take', 'trade': 'exchange', 'exchange': 'swap',
+    'purchase': 'buy', 'pay': 'give', 'receive': 'take',
+    'deliver': 'bring', 'transport': 'carry', 'load': 'put', 'unload': 'take',
+    'pack': 'wrap', 'unpack': 'open', 'inventory': 'count', 'stock': 'store',
+    'supply': 'give', 'allocate': 'divide',
+    
+    # Medical - Healthcare actions
+    'diagnose': 'check', 'examine': 'look', 'check': 'see', 'test': 'try',
+    'scan': 'look', 'cure': 'heal', 'heal': 'fix', 'recover': 'improve',
+    'rehabilitate': 'exercise', 'inject': 'needle', 'vaccinate': 'inject',
+    'medicate': 'medicine', 'prescribe': 'write', 'dose': 'give',
+    'bandage': 'wrap', 'stitch': 'sew', 'operate': 'cut', 'surgery': 'operate',
+    'temperature': 'hot', 'pressure': 'push', 'pulse': 'heart', 'heartbeat': 'heart',
+    'cough': 'sick', 'sneeze': 'blow', 'vomit': 'sick', 'bleed': 'blood',
+    'hurt': 'pain', 'pain': 'hurt', 'ache': 'pain',
+    
+    # Food Preparation - Cooking actions
+    'chop': 'cut', 'cut': 'cut', 'slice': 'cut', 'dice': 'cut',
+    'mince': 'cut', 'shred': 'tear', 'grate': 'rub',
+    'peel': 'remove', 'skin': 'remove', 'core': 'remove', 'pit': 'remove',
+    'seed': 'remove', 'mix': 'stir', 'stir': 'mix', 'blend': 'mix',
+    'whisk': 'stir', 'beat': 'mix', 'knead': 'press', 'shape': 'form',
+    'form': 'make', 'mold': 'shape', 'season': 'add', 'salt': 'sprinkle',
+    'pepper': 'sprinkle', 'spice': 'add', 'flavor': 'taste', 'taste': 'eat',
+    'roast': 'cook', 'broil': 'cook', 'toast': 'cook',
+    'sauté': 'fry', 'simmer': 'boil', 'poach': 'boil', 'blanch': 'boil',
+    'serve': 'give', 'plate': 'put', 'garnish': 'decorate', 'present': 'show',
+    
+    # Technology - Tech actions
+    'click': 'press', 'tap': 'touch', 'swipe': 'move', 'scroll': 'move',
+    'zoom': 'enlarge', 'keyboard': 'type', 'mouse': 'point', 'touchscreen': 'touch',
+    'screen': 'see', 'download': 'receive', 'upload': 'send', 'send': 'give',
+    'share': 'give', 'forward': 'send', 'save': 'keep', 'delete': 'remove',
+    'copy': 'duplicate', 'paste': 'put', 'undo': 'reverse', 'redo': 'repeat',
+    'search': 'find', 'browse': 'look', 'navigate': 'go', 'surf': 'browse',
+    'explore': 'discover', 'connect': 'join', 'disconnect': 'separate',
+    'login': 'enter', 'logout': 'exit', 'signin': 'enter', 'signout': 'leave',
+    'charge': 'power', 'battery': 'energy', 'power': 'on', 'switch': 'toggle',
+    'button': 'press', 'press': 'push',
+    
+    # Household - Home actions
+    'iron': 'press', 'hang': 'suspend', 'dry': 'remove', 'rinse': 'wash',
+    'spin': 'rotate', 'sort': 'separate', 'separate': 'divide',
+    'decorate': 'beautify', 'rearrange': 'move', 'place': 'put',
+    'position': 'place', 'plug': 'connect', 'unplug': 'disconnect',
+    'light': 'shine', 'dim': 'darken', 'brighten': 'light',
+    'heat': 'warm', 'cool': 'cold', 'warm': 'heat', 'freeze': 'cold',
+    'thaw': 'melt', 'secure': 'protect', 'guard': 'protect',
+    
+    # Shopping - Shopping actions
+    'shop': 'buy', 'browse': 'look', 'select': 'choose', 'choose': 'pick',
+    'pick': 'select', 'decide': 'choose', 'order': 'request', 'checkout': 'pay',
+    'bargain': 'negotiate', 'negotiate': 'discuss', 'discount': 'reduce',
+    'sale': 'sell', 'offer': 'give', 'return': 'give', 'refund': 'return',
+    'complain': 'protest', 'wrap': 'cover', 'bag': 'pack', 'box': 'pack',
+    
+    # Education - Learning actions
+    'spell': 'write', 'pronounce': 'say', 'recite': 'speak',
+    'memorize': 'remember', 'remember': 'recall', 'recall': 'think',
+    'review': 'check', 'revise': 'change', 'solve': 'answer',
+    'compute': 'calculate', 'add': 'plus', 'subtract': 'minus',
+    'multiply': 'times', 'divide': 'split', 'experiment': 'test',
+    'record': 'write', 'note': 'write', 'clarify': 'explain',
+    'illustrate': 'show', 'query': 'ask', 'inquire': 'ask',
+    'investigate': 'examine', 'research': 'study',
+    
+    # Social - Social interactions
+    'meet': 'greet', 'greet': 'hello', 'welcome': 'greet', 'introduce': 'present',
+    'hug': 'embrace', 'kiss': 'love', 'embrace': 'hold',
+    'smile': 'happy', 'laugh': 'happy', 'giggle': 'laugh', 'grin': 'smile',
+    'chuckle': 'laugh', 'cry': 'sad', 'weep': 'cry', 'sob': 'cry',
+    'tear': 'sad', 'sad': 'unhappy', 'angry': 'mad', 'mad': 'angry',
+    'furious': 'angry', 'upset': 'sad', 'irritated': 'annoyed',
+    'happy': 'joy', 'joyful': 'happy', 'cheerful': 'happy', 'excited': 'enthusiastic',
+    'thrilled': 'excited', 'surprised': 'shock', 'shocked': 'surprise',
+    'amazed': 'wonder', 'astonished': 'surprised', 'confused': 'puzzled',
+    'puzzled': 'confused', 'uncertain': 'doubt', 'doubtful': 'unsure',
+    
+    # Transportation - Travel actions
+    'board': 'enter', 'embark': 'board', 'disembark': 'exit', 'alight': 'descend',
+    'exit': 'leave', 'accelerate': 'quick', 'brake': 'stop', 'stop': 'halt',
+    'park': 'stop', 'reverse': 'backward', 'steer': 'direct', 'direct': 'guide',
+    'guide': 'lead', 'lead': 'direct', 'travel': 'journey', 'journey': 'go',
+    'commute': 'travel', 'transfer': 'change', 'sail': 'boat',
+    'cruise': 'sail', 'voyage': 'travel',
+    
+    # Agricultural - Farming actions
+    'plant': 'sow', 'sow': 'plant', 'seed': 'plant', 'grow': 'develop',
+    'cultivate': 'farm', 'farm': 'work', 'plow': 'dig', 'till': 'plow',
+    'dig': 'excavate', 'hoe': 'dig', 'rake': 'gather', 'weed': 'remove',
+    'water': 'pour', 'irrigate': 'water', 'spray': 'sprinkle',
+    'fertilize': 'feed', 'compost': 'fertilize', 'harvest': 'gather',
+    'reap': 'harvest', 'gather': 'collect', 'collect': 'gather',
+    'prune': 'cut', 'trim': 'cut', 'crop': 'harvest', 'thresh': 'separate',
+    
+    # Construction - Building actions
+    'demolish': 'destroy', 'dismantle': 'take', 'excavate': 'dig',
+    'drill': 'bore', 'bore': 'drill', 'tunnel': 'dig',
+    'pour': 'flow', 'concrete': 'build', 'cement': 'join', 'plaster': 'cover',
+    'hammer': 'hit', 'nail': 'fasten', 'screw': 'turn', 'bolt': 'fasten',
+    'weld': 'join', 'saw': 'cut', 'sand': 'smooth', 'polish': 'shine',
+    'level': 'balance', 'align': 'straight', 'square': 'measure', 'plumb': 'straight',
+    
+    # Environmental - Nature actions
+    'recycle': 'reuse', 'reuse': 'again', 'reduce': 'less', 'conserve': 'save',
+    'preserve': 'keep', 'pollute': 'dirty', 'contaminate': 'pollute',
+    'dirty': 'soil', 'purify': 'clean', 'tree': 'plant', 'garden': 'grow',
+    'landscape': 'beautify', 'green': 'plant',
+    
+    # Financial - Money actions
+    'earn': 'make', 'gain': 'receive', 'profit': 'gain', 'income': 'earn',
+    'spend': 'use', 'invest': 'put', 'deposit': 'put', 'withdraw': 'take',
+    'borrow': 'loan', 'lend': 'give', 'loan': 'lend', 'credit': 'borrow',
+    'debt': 'owe', 'budget': 'plan', 'account': 'record', 'balance': 'equal',
+    
+    # Legal - Law actions
+    'sue': 'prosecute', 'prosecute': 'accuse', 'defend': 'protect',
+    'plead': 'beg', 'judge': 'decide', 'rule': 'judge', 'decide': 'choose',
+    'verdict': 'decision', 'sentence': 'punish', 'arrest': 'catch',
+    'detain': 'hold', 'custody': 'jail', 'jail': 'prison', 'prison': 'lock',
+    'fine': 'penalty', 'penalty': 'punish', 'punish': 'discipline',
+    'reward': 'prize', 'compensate': 'pay',
+}))
+
+# Categorize words for better organization
+CATEGORIES = MappingProxyType({
+    'Disaster Management': ['evacuate', 'rescue', 'distribute', 'deploy', 'search', 'alert', 'warn', 'emergency', 'danger', 'safe', 'shelter', 'relief'],
+    'Movement Actions': ['walk', 'run', 'jump', 'sit', 'stand', 'climb', 'swim', 'fly', 'drive', 'ride', 'jog', 'sprint', 'leap'],
+    'Hand Actions': ['push', 'pull', 'lift', 'carry', 'hold', 'grab', 'throw', 'catch', 'touch', 'point', 'wave', 'shake'],
+    'Daily Activities': ['eat', 'drink', 'cook', 'clean', 'wash', 'read', 'write', 'study', 'work', 'play', 'brush', 'bath'],
+    'Communication': ['talk', 'speak', 'listen', 'watch', 'call', 'text', 'email', 'sign', 'gesture', 'ask', 'answer'],
+    'Sports & Exercise': ['exercise', 'kick', 'bat', 'serve', 'box', 'wrestle', 'yoga', 'meditate', 'train', 'race'],
+    'Professional': ['build', 'repair', 'operate', 'manage', 'produce', 'sell', 'deliver', 'inventory', 'design', 'plan'],
+    'Medical': ['diagnose', 'examine', 'treat', 'inject', 'bandage', 'operate', 'measure', 'cough', 'heal', 'cure'],
+    'Food Preparation': ['chop', 'cut', 'mix', 'stir', 'bake', 'fry', 'boil', 'serve', 'slice', 'peel'],
+    'Technology': ['click', 'type', 'download', 'save', 'search', 'connect', 'charge', 'upload', 'delete', 'browse'],
+    'Household': ['iron', 'fold', 'hang', 'load', 'decorate', 'plug', 'heat', 'lock', 'sweep', 'mop'],
+    'Shopping': ['shop', 'browse', 'buy', 'bargain', 'return', 'pack', 'select', 'choose', 'pay'],
+    'Education': ['spell', 'memorize', 'solve', 'experiment', 'present', 'research', 'learn', 'teach', 'practice'],
+    'Social': ['meet', 'greet', 'smile', 'laugh', 'cry', 'hug', 'kiss', 'welcome', 'introduce'],
+    'Transportation': ['board', 'accelerate', 'brake', 'steer', 'travel', 'sail', 'exit', 'park', 'commute'],
+    'Agricultural': ['plant', 'plow', 'water', 'harvest', 'prune', 'grow', 'cultivate', 'seed'],
+    'Construction': ['construct', 'demolish', 'drill', 'hammer', 'saw', 'measure', 'weld', 'nail'],
+    'Environmental': ['recycle', 'conserve', 'pollute', 'plant', 'protect', 'preserve', 'reduce', 'reuse'],
+    'Financial': ['earn', 'spend', 'save', 'borrow', 'budget', 'invest', 'pay', 'receive'],
+    'Legal': ['sue', 'judge', 'arrest', 'fine', 'prosecute', 'defend', 'rule'],
+})
+
+# Map words to categories
+WORD_TO_CATEGORY = MappingProxyType(intern_mapping({
+    word: category for category, words in CATEGORIES.items() for word in words
+}))
+
+# Combine all vocabularies
+ALL_WORDS = frozenset(map(sys.intern, chain(CISLR_VOCABULARY, INCLUDE_VOCABULARY, ISLTRANSLATE_VOCABULARY)))
+
+# Every vocabulary word once, interned and in output order
+VOCABULARY = tuple(sorted(ALL_WORDS))
+
+# Sign names are stored lowercase, so words and mapped actions must be too
+assert all(word == word.lower() for word in VOCABULARY), "vocabulary must be lowercase"
+assert all(sign == sign.lower() for sign in ACTION_MAPPINGS.values()), "action mappings must be lowercase"
+
+def stem_word(word: str) -> str:
+    """Strip one trailing -ing / -ed / -es / -s suffix to get the base word"""
+    for suffix in ('ing', 'ed', 'es', 's'):
+        if word.endswith(suffix) and len(word) > len(suffix):
+            return word.removesuffix(suffix)
+    return word
+
+# Base word used for mapping lookups, computed once per vocabulary word
+BASE_WORDS = MappingProxyType({word: stem_word(word) for word in ALL_WORDS})
+
+# Use a common fallback action that exists
+FALLBACK_SIGN = 'do' if 'do' in AVAILABLE_SIGNS else 'work'
+
+def resolve_sign(word: str) -> str:
+    """Get the CHARACTER ACTION for a word, falling back to a sign file that exists"""
+    base_word = BASE_WORDS[word]
+    sign_action = ACTION_MAPPINGS.get(word, ACTION_MAPPINGS.get(base_word, word))
+    
+    # VALIDATE: Check if sign file actually exists
+    if sign_action in AVAILABLE_SIGNS:
+        return sign_action
+    
+    # Fallback chain: try the word itself, then base word, then 'do'
+    if word in AVAILABLE_SIGNS:
+        return word
+    if base_word in AVAILABLE_SIGNS:
+        return base_word
+    return FALLBACK_SIGN
+
+class Entry(NamedTuple):
+    """One dataset entry; field names match the exported keys"""
+    word: str
+    sign: str
+    sovExample: str
+    category: str
 
-def generate_action_dataset() -> List[Dict[str, str]]:
+@dataclass
+class ActionDataset:
+    """Column-oriented dataset: one parallel list per field, rows are zipped on demand"""
+    words: List[str] = field(default_factory=list)
+    signs: List[str] = field(default_factory=list)
+    sov_examples: List[str] = field(default_factory=list)
+    categories: List[str] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.words)
+    
+    def rows(self) -> Iterator[Entry]:
+        """Iterate entries lazily as fixed-layout tuples"""
+        return map(Entry._make, zip(self.words, self.signs, self.sov_examples, self.categories))
+
+# SOV example pattern per category
+SOV_TEMPLATES = MappingProxyType({
+    'Disaster Management': 'I people {w}',
+    'Movement Actions': 'I now {w}',
+    'Hand Actions': 'I now {w}',
+    'Daily Activities': 'I {w} do',
+})
+DEFAULT_SOV_TEMPLATE = 'I {w}'
+
+# (word, SOV example) for each -ing / -ed variation; words already ending in the suffix get none
+ING_VARIATIONS = MappingProxyType({
+    word: (f"{word}ing" if not word.endswith('e') else f"{word[:-1]}ing", f"I {word}ing am")
+    for word in VOCABULARY if not word.endswith('ing')
+})
+ED_VARIATIONS = MappingProxyType({
+    word: (f"{word}ed" if not word.endswith('e') else f"{word}d", f"I yesterday {word}ed")
+    for word in VOCABULARY if not word.endswith('ed')
+})
+
+def word_forms(word: str, category: str) -> Tuple[Tuple[str, str], ...]:
+    """Return (word, SOV example) pairs for the base word and its -ing / -ed variations"""
+    # Generate proper SOV example with action
+    sov_example = SOV_TEMPLATES.get(category, DEFAULT_SOV_TEMPLATE).format(w=word)
+    
+    # Add base word
+    forms = ((word, sov_example),)
+    
+    # Add -ing variation
+    if word in ING_VARIATIONS:
+        forms += (ING_VARIATIONS[word],)
+    
+    # Add -ed variation
+    if word in ED_VARIATIONS:
+        forms += (ED_VARIATIONS[word],)
+    
+    return forms
+
+class DatasetTables(NamedTuple):
+    """Resolved sign, category and word forms per vocabulary word, aligned with VOCABULARY"""
+    signs: Tuple[str, ...]
+    categories: Tuple[str, ...]
+    forms: Tuple[Tuple[Tuple[str, str], ...], ...]
+
+@cache
+def build_tables() -> DatasetTables:
+    """Resolve the per-word tables once; later calls return the cached result"""
+    signs = tuple(resolve_sign(word) for word in VOCABULARY)
+    categories = tuple(WORD_TO_CATEGORY.get(word, 'General') for word in VOCABULARY)
+    forms = tuple(word_forms(word, category) for word, category in zip(VOCABULARY, categories))
+    return DatasetTables(signs, categories, forms)
+
+def generate_action_dataset() -> ActionDataset:
     """
     Generate comprehensive ISL action dataset combining all sources
     Each entry has: word, sign (CHARACTER ACTION), SOV example, category
     """
-    dataset = []
-    
-    # Combine all vocabularies
-    all_words = set(CISLR_VOCABULARY + INCLUDE_VOCABULARY + ISLTRANSLATE_VOCABULARY)
-    
-    # COMPREHENSIVE ACTION MAPPINGS - Word to Character Action
-    # This maps each word to what the CHARACTER/AVATAR DOES (the action, not the word)
-    action_mappings = {
-        # Disaster Management - Character Actions
-        'evacuate': 'run', 'rescue': 'carry', 'distribute': 'give', 'deploy': 'send',
-        'search': 'look', 'alert': 'call', 'warn': 'wave', 'emergency': 'run',
-        'danger': 'stop', 'safe': 'protect', 'shelter': 'house', 'relief': 'help',
-        'aid': 'give', 'support': 'hold', 'assist': 'help', 'protect': 'guard',
-        'injured': 'fall', 'injury': 'hurt', 'medical': 'hospital', 'medicine': 'pill',
-        'treat': 'care', 'flood': 'water', 'earthquake': 'shake', 'fire': 'burn',
-        'storm': 'wind', 'cyclone': 'spin', 'tsunami': 'wave', 'landslide': 'fall',
-        'disaster': 'break', 'crisis': 'problem', 'victim': 'person', 'survivor': 'person',
-        'damage': 'break', 'destroy': 'break', 'rebuild': 'build', 'recover': 'heal',
-        
-        # Movement - Character performs these actions
-        'walk': 'walk', 'run': 'run', 'jog': 'run', 'sprint': 'run',
-        'jump': 'jump', 'leap': 'jump', 'hop': 'jump', 'skip': 'jump',
-        'sit': 'sit', 'stand': 'stand', 'lie': 'sleep', 'kneel': 'bow',
-        'crouch': 'bend', 'bend': 'bow', 'bow': 'bow', 'stretch': 'reach',
-        'crawl': 'move', 'climb': 'up', 'descend': 'down', 'ascend': 'up',
-        'swim': 'swim', 'dive': 'jump', 'float': 'swim',
-        'fly': 'fly', 'drive': 'car', 'ride': 'bike', 'pedal': 'cycle',
-        'roll': 'turn', 'spin': 'turn', 'rotate': 'turn', 'twist': 'turn',
-        'turn': 'turn', 'slide': 'move', 'slip': 'fall', 'fall': 'fall',
-        'trip': 'fall', 'stumble': 'fall',
-        
-        # Hand & Arm Actions - What character does with hands
-        'push': 'push', 'pull': 'pull', 'lift': 'carry', 'carry': 'carry',
-        'hold': 'hold', 'grab': 'take', 'grasp': 'hold', 'grip': 'hold',
-        'release': 'open', 'drop': 'fall', 'throw': 'throw', 'toss': 'throw',
-        'catch': 'catch', 'hit': 'strike', 'strike': 'hit', 'punch': 'hit',
-        'slap': 'hit', 'clap': 'clap', 'point': 'show', 'wave': 'wave',
-        'shake': 'shake', 'touch': 'touch', 'feel': 'touch', 'scratch': 'rub',
-        'rub': 'rub', 'pat': 'touch', 'tap': 'touch', 'poke': 'touch',
-        'squeeze': 'press', 'pinch': 'hold', 'tear': 'break', 'fold': 'fold',
-        'unfold': 'open', 'open': 'open', 'close': 'close', 'lock': 'lock',
-        'unlock': 'open',
-        
-        # Daily Activities - Character's daily actions
-        'eat': 'eat', 'drink': 'drink', 'cook': 'cook', 'bake': 'cook',
-        'fry': 'cook', 'boil': 'cook', 'steam': 'cook', 'grill': 'cook',
-        'clean': 'wash', 'wash': 'wash', 'wipe': 'clean', 'scrub': 'wash',
-        'sweep': 'clean', 'mop': 'clean', 'vacuum': 'clean', 'dust': 'clean',
-        'bath': 'wash', 'shower': 'wash', 'brush': 'brush', 'comb': 'brush',
-        'shave': 'cut', 'dress': 'wear', 'wear': 'put', 'remove': 'take',
-        'read': 'read', 'write': 'write', 'draw': 'draw', 'paint': 'draw',
-        'sketch': 'draw', 'color': 'draw', 'erase': 'delete',
-        'study': 'learn', 'learn': 'learn', 'teach': 'teach', 'explain': 'show',
-        'demonstrate': 'show', 'practice': 'do', 'work': 'work', 'type': 'write',
-        'calculate': 'think', 'measure': 'check', 'weigh': 'measure', 'count': 'count',
-        
-        # Communication - How character communicates
-        'talk': 'speak', 'speak': 'speak', 'say': 'speak', 'tell': 'speak',
-        'ask': 'ask', 'answer': 'reply', 'question': 'ask', 'reply': 'answer',
-        'call': 'phone', 'text': 'write', 'email': 'write', 'message': 'send',
-        'chat': 'talk', 'discuss': 'talk', 'argue': 'fight', 'debate': 'talk',
-        'listen': 'hear', 'hear': 'hear', 'watch': 'see', 'see': 'look',
-        'look': 'see', 'observe': 'watch', 'examine': 'check', 'inspect': 'check',
-        'understand': 'know', 'comprehend': 'know', 'interpret': 'think',
-        'translate': 'change', 'sign': 'gesture', 'gesture': 'show',
-        'indicate': 'point', 'signal': 'wave', 'express': 'show', 'communicate': 'talk',
-        
-        # Sports - Character playing/doing sports
-        'play': 'play', 'exercise': 'move', 'train': 'practice', 'compete': 'fight',
-        'race': 'run', 'win': 'celebrate', 'lose': 'sad',
-        'kick': 'kick', 'dribble': 'move', 'pass': 'throw', 'shoot': 'throw',
-        'score': 'goal', 'defend': 'block', 'attack': 'fight',
-        'bat': 'hit', 'bowl': 'throw', 'field': 'catch', 'pitch': 'throw',
-        'serve': 'throw', 'volley': 'hit', 'smash': 'hit', 'rally': 'play',
-        'box': 'fight', 'wrestle': 'fight', 'fight': 'fight',
-        'yoga': 'balance', 'meditate': 'sit', 'balance': 'stand', 'pose': 'stand',
-        
-        # Professional - Work actions
-        'build': 'make', 'construct': 'build', 'assemble': 'join', 'install': 'put',
-        'repair': 'fix', 'fix': 'repair', 'maintain': 'check',
-        'design': 'plan', 'plan': 'think', 'organize': 'arrange', 'arrange': 'order',
-        'prepare': 'make', 'setup': 'arrange',
-        'operate': 'use', 'control': 'manage', 'manage': 'lead', 'supervise': 'watch',
-        'coordinate': 'organize', 'produce': 'make', 'manufacture': 'make',
-        'create': 'make', 'make': 'make', 'craft': 'make',
-        'sell': 'give', 'buy': 'take', 'trade': 'exchange', 'exchange': 'swap',
-        'purchase': 'buy', 'pay': 'give', 'receive': 'take',
-        'deliver': 'bring', 'transport': 'carry', 'load': 'put', 'unload': 'take',
-        'pack': 'wrap', 'unpack': 'open', 'inventory': 'count', 'stock': 'store',
-        'supply': 'give', 'allocate': 'divide',
-        
-        # Medical - Healthcare actions
-        'diagnose': 'check', 'examine': 'look', 'check': 'see', 'test': 'try',
-        'scan': 'look', 'cure': 'heal', 'heal': 'fix', 'recover': 'improve',
-        'rehabilitate': 'exercise', 'inject': 'needle', 'vaccinate': 'inject',
-        'medicate': 'medicine', 'prescribe': 'write', 'dose': 'give',
-        'bandage': 'wrap', 'stitch': 'sew', 'operate': 'cut', 'surgery': 'operate',
-        'temperature': 'hot', 'pressure': 'push', 'pulse': 'heart', 'heartbeat': 'heart',
-        'cough': 'sick', 'sneeze': 'blow', 'vomit': 'sick', 'bleed': 'blood',
-        'hurt': 'pain', 'pain': 'hurt', 'ache': 'pain',
-        
-        # Food Preparation - Cooking actions
-        'chop': 'cut', 'cut': 'cut', 'slice': 'cut', 'dice': 'cut',
-        'mince': 'cut', 'shred': 'tear', 'grate': 'rub',
-        'peel': 'remove', 'skin': 'remove', 'core': 'remove', 'pit': 'remove',
-        'seed': 'remove', 'mix': 'stir', 'stir': 'mix', 'blend': 'mix',
-        'whisk': 'stir', 'beat': 'mix', 'knead': 'press', 'shape': 'form',
-        'form': 'make', 'mold': 'shape', 'season': 'add', 'salt': 'sprinkle',
-        'pepper': 'sprinkle', 'spice': 'add', 'flavor': 'taste', 'taste': 'eat',
-        'roast': 'cook', 'broil': 'cook', 'toast': 'cook',
-        'sauté': 'fry', 'simmer': 'boil', 'poach': 'boil', 'blanch': 'boil',
-        'serve': 'give', 'plate': 'put', 'garnish': 'decorate', 'present': 'show',
-        
-        # Technology - Tech actions
-        'click': 'press', 'tap': 'touch', 'swipe': 'move', 'scroll': 'move',
-        'zoom': 'enlarge', 'keyboard': 'type', 'mouse': 'point', 'touchscreen': 'touch',
-        'screen': 'see', 'download': 'receive', 'upload': 'send', 'send': 'give',
-        'share': 'give', 'forward': 'send', 'save': 'keep', 'delete': 'remove',
-        'copy': 'duplicate', 'paste': 'put', 'undo': 'reverse', 'redo': 'repeat',
-        'search': 'find', 'browse': 'look', 'navigate': 'go', 'surf': 'browse',
-        'explore': 'discover', 'connect': 'join', 'disconnect': 'separate',
-        'login': 'enter', 'logout': 'exit', 'signin': 'enter', 'signout': 'leave',
-        'charge': 'power', 'battery': 'energy', 'power': 'on', 'switch': 'toggle',
-        'button': 'press', 'press': 'push',
-        
-        # Household - Home actions
-        'iron': 'press', 'hang': 'suspend', 'dry': 'remove', 'rinse': 'wash',
-        'spin': 'rotate', 'sort': 'separate', 'separate': 'divide',
-        'decorate': 'beautify', 'rearrange': 'move', 'place': 'put',
-        'position': 'place', 'plug': 'connect', 'unplug': 'disconnect',
-        'light': 'shine', 'dim': 'darken', 'brighten': 'light',
-        'heat': 'warm', 'cool': 'cold', 'warm': 'heat', 'freeze': 'cold',
-        'thaw': 'melt', 'secure': 'protect', 'guard': 'protect',
-        
-        # Shopping - Shopping actions
-        'shop': 'buy', 'browse': 'look', 'select': 'choose', 'choose': 'pick',
-        'pick': 'select', 'decide': 'choose', 'order': 'request', 'checkout': 'pay',
-        'bargain': 'negotiate', 'negotiate': 'discuss', 'discount': 'reduce',
-        'sale': 'sell', 'offer': 'give', 'return': 'give', 'refund': 'return',
-        'complain': 'protest', 'wrap': 'cover', 'bag': 'pack', 'box': 'pack',
-        
-        # Education - Learning actions
-        'spell': 'write', 'pronounce': 'say', 'recite': 'speak',
-        'memorize': 'remember', 'remember': 'recall', 'recall': 'think',
-        'review': 'check', 'revise': 'change', 'solve': 'answer',
-        'compute': 'calculate', 'add': 'plus', 'subtract': 'minus',
-        'multiply': 'times', 'divide': 'split', 'experiment': 'test',
-        'record': 'write', 'note': 'write', 'clarify': 'explain',
-        'illustrate': 'show', 'query': 'ask', 'inquire': 'ask',
-        'investigate': 'examine', 'research': 'study',
-        
-        # Social - Social interactions
-        'meet': 'greet', 'greet': 'hello', 'welcome': 'greet', 'introduce': 'present',
-        'hug': 'embrace', 'kiss': 'love', 'embrace': 'hold',
-        'smile': 'happy', 'laugh': 'happy', 'giggle': 'laugh', 'grin': 'smile',
-        'chuckle': 'laugh', 'cry': 'sad', 'weep': 'cry', 'sob': 'cry',
-        'tear': 'sad', 'sad': 'unhappy', 'angry': 'mad', 'mad': 'angry',
-        'furious': 'angry', 'upset': 'sad', 'irritated': 'annoyed',
-        'happy': 'joy', 'joyful': 'happy', 'cheerful': 'happy', 'excited': 'enthusiastic',
-        'thrilled': 'excited', 'surprised': 'shock', 'shocked': 'surprise',
-        'amazed': 'wonder', 'astonished': 'surprised', 'confused': 'puzzled',
-        'puzzled': 'confused', 'uncertain': 'doubt', 'doubtful': 'unsure',
-        
-        # Transportation - Travel actions
-        'board': 'enter', 'embark': 'board', 'disembark': 'exit', 'alight': 'descend',
-        'exit': 'leave', 'accelerate': 'quick', 'brake': 'stop', 'stop': 'halt',
-        'park': 'stop', 'reverse': 'backward', 'steer': 'direct', 'direct': 'guide',
-        'guide': 'lead', 'lead': 'direct', 'travel': 'journey', 'journey': 'go',
-        'commute': 'travel', 'transfer': 'change', 'sail': 'boat',
-        'cruise': 'sail', 'voyage': 'travel',
-        
-        # Agricultural - Farming actions
-        'plant': 'sow', 'sow': 'plant', 'seed': 'plant', 'grow': 'develop',
-        'cultivate': 'farm', 'farm': 'work', 'plow': 'dig', 'till': 'plow',
-        'dig': 'excavate', 'hoe': 'dig', 'rake': 'gather', 'weed': 'remove',
-        'water': 'pour', 'irrigate': 'water', 'spray': 'sprinkle',
-        'fertilize': 'feed', 'compost': 'fertilize', 'harvest': 'gather',
-        'reap': 'harvest', 'gather': 'collect', 'collect': 'gather',
-        'prune': 'cut', 'trim': 'cut', 'crop': 'harvest', 'thresh': 'separate',
-        
-        # Construction - Building actions
-        'demolish': 'destroy', 'dismantle': 'take', 'excavate': 'dig',
-        'drill': 'bore', 'bore': 'drill', 'tunnel': 'dig',
-        'pour': 'flow', 'concrete': 'build', 'cement': 'join', 'plaster': 'cover',
-        'hammer': 'hit', 'nail': 'fasten', 'screw': 'turn', 'bolt': 'fasten',
-        'weld': 'join', 'saw': 'cut', 'sand': 'smooth', 'polish': 'shine',
-        'level': 'balance', 'align': 'straight', 'square': 'measure', 'plumb': 'straight',
-        
-        # Environmental - Nature actions
-        'recycle': 'reuse', 'reuse': 'again', 'reduce': 'less', 'conserve': 'save',
-        'preserve': 'keep', 'pollute': 'dirty', 'contaminate': 'pollute',
-        'dirty': 'soil', 'purify': 'clean', 'tree': 'plant', 'garden': 'grow',
-        'landscape': 'beautify', 'green': 'plant',
-        
-        # Financial - Money actions
-        'earn': 'make', 'gain': 'receive', 'profit': 'gain', 'income': 'earn',
-        'spend': 'use', 'invest': 'put', 'deposit': 'put', 'withdraw': 'take',
-        'borrow': 'loan', 'lend': 'give', 'loan': 'lend', 'credit': 'borrow',
-        'debt': 'owe', 'budget': 'plan', 'account': 'record', 'balance': 'equal',
-        
-        # Legal - Law actions
-        'sue': 'prosecute', 'prosecute': 'accuse', 'defend': 'protect',
-        'plead': 'beg', 'judge': 'decide', 'rule': 'judge', 'decide': 'choose',
-        'verdict': 'decision', 'sentence': 'punish', 'arrest': 'catch',
-        'detain': 'hold', 'custody': 'jail', 'jail': 'prison', 'prison': 'lock',
-        'fine': 'penalty', 'penalty': 'punish', 'punish': 'discipline',
-        'reward': 'prize', 'compensate': 'pay',
-    }
-    
-    # Categorize words for better organization
-    categories = {
-        'Disaster Management': ['evacuate', 'rescue', 'distribute', 'deploy', 'search', 'alert', 'warn', 'emergency', 'danger', 'safe', 'shelter', 'relief'],
-        'Movement Actions': ['walk', 'run', 'jump', 'sit', 'stand', 'climb', 'swim', 'fly', 'drive', 'ride', 'jog', 'sprint', 'leap'],
-        'Hand Actions': ['push', 'pull', 'lift', 'carry', 'hold', 'grab', 'throw', 'catch', 'touch', 'point', 'wave', 'shake'],
-        'Daily Activities': ['eat', 'drink', 'cook', 'clean', 'wash', 'read', 'write', 'study', 'work', 'play', 'brush', 'bath'],
-        'Communication': ['talk', 'speak', 'listen', 'watch', 'call', 'text', 'email', 'sign', 'gesture', 'ask', 'answer'],
-        'Sports & Exercise': ['exercise', 'kick', 'bat', 'serve', 'box', 'wrestle', 'yoga', 'meditate', 'train', 'race'],
-        'Professional': ['build', 'repair', 'operate', 'manage', 'produce', 'sell', 'deliver', 'inventory', 'design', 'plan'],
-        'Medical': ['diagnose', 'examine', 'treat', 'inject', 'bandage', 'operate', 'measure', 'cough', 'heal', 'cure'],
-        'Food Preparation': ['chop', 'cut', 'mix', 'stir', 'bake', 'fry', 'boil', 'serve', 'slice', 'peel'],
-        'Technology': ['click', 'type', 'download', 'save', 'search', 'connect', 'charge', 'upload', 'delete', 'browse'],
-        'Household': ['iron', 'fold', 'hang', 'load', 'decorate', 'plug', 'heat', 'lock', 'sweep', 'mop'],
-        'Shopping': ['shop', 'browse', 'buy', 'bargain', 'return', 'pack', 'select', 'choose', 'pay'],
-        'Education': ['spell', 'memorize', 'solve', 'experiment', 'present', 'research', 'learn', 'teach', 'practice'],
-        'Social': ['meet', 'greet', 'smile', 'laugh', 'cry', 'hug', 'kiss', 'welcome', 'introduce'],
-        'Transportation': ['board', 'accelerate', 'brake', 'steer', 'travel', 'sail', 'exit', 'park', 'commute'],
-        'Agricultural': ['plant', 'plow', 'water', 'harvest', 'prune', 'grow', 'cultivate', 'seed'],
-        'Construction': ['construct', 'demolish', 'drill', 'hammer', 'saw', 'measure', 'weld', 'nail'],
-        'Environmental': ['recycle', 'conserve', 'pollute', 'plant', 'protect', 'preserve', 'reduce', 'reuse'],
-        'Financial': ['earn', 'spend', 'save', 'borrow', 'budget', 'invest', 'pay', 'receive'],
-        'Legal': ['sue', 'judge', 'arrest', 'fine', 'prosecute', 'defend', 'rule'],
-    }
-    
-    # Map words to categories
-    word_to_category = {}
-    for category, words in categories.items():
-        for word in words:
-            word_to_category[word] = category
-    
-    # Generate dataset entries with proper action mappings
-    for word in sorted(all_words):
-        category = word_to_category.get(word, 'General')
-        
-        # Get the CHARACTER ACTION for this word
-        base_word = word.replace('ing', '').replace('ed', '').replace('es', '').replace('s', '')
-        sign_action = action_mappings.get(word, action_mappings.get(base_word, word.lower()))
-        
-        # VALIDATE: Check if sign file actually exists
-        if sign_action.lower() not in AVAILABLE_SIGNS:
-            # Fallback chain: try the word itself, then base word, then 'do'
-            if word.lower() in AVAILABLE_SIGNS:
-                sign_action = word.lower()
-            elif base_word.lower() in AVAILABLE_SIGNS:
-                sign_action = base_word.lower()
-            else:
-                # Use a common fallback action that exists
-                sign_action = 'do' if 'do' in AVAILABLE_SIGNS else 'work'
-        
-        # Generate proper SOV example with action
-        if category == 'Disaster Management':
-            sov_example = f"I people {word}"
-        elif category in ['Movement Actions', 'Hand Actions']:
-            sov_example = f"I now {word}"
-        elif 'Daily' in category or 'Activities' in category:
-            sov_example = f"I {word} do"
-        else:
-            sov_example = f"I {word}"
-        
-        # Add base word
-        dataset.append({
-            'word': word,
-            'sign': sign_action,
-            'sovExample': sov_example,
-            'category': category
-        })
-        
-        # Add -ing variation
-        if not word.endswith('ing'):
-            dataset.append({
-                'word': f"{word}ing" if not word.endswith('e') else f"{word[:-1]}ing",
-                'sign': sign_action,
-                'sovExample': f"I {word}ing am",
-                'category': category
-            })
-        
-        # Add -ed variation
-        if not word.endswith('ed'):
-            dataset.append({
-                'word': f"{word}ed" if not word.endswith('e') else f"{word}d",
-                'sign': sign_action,
-                'sovExample': f"I yesterday {word}ed",
-                'category': category
-            })
-    
-    return dataset
-
-def export_to_json(dataset: List[Dict], output_file: str = 'isl-dataset.json'):
-    """Export dataset to JSON file"""
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(dataset, f, indent=2, ensure_ascii=False)
+    # Everything per word is precomputed, so each column is a single comprehension
+    signs, categories, forms = build_tables()
+    
+    return ActionDataset(
+        words=[form for word_group in forms for form, _ in word_group],
+        signs=[sign for sign, word_group in zip(signs, forms) for _ in word_group],
+        sov_examples=[sov_example for word_group in forms for _, sov_example in word_group],
+        categories=[category for category, word_group in zip(categories, forms) for _ in word_group],
+    )
+
+def export_to_json(dataset: ActionDataset, output_file: str = 'isl-dataset.json', pretty: bool = False):
+    """Export dataset to JSON file (compact by default, indented when pretty=True)"""
+    if pretty:
+        layout = {'indent': 2, 'separators': (',', ': ')}
+    else:
+        layout = {'separators': (',', ':')}
+    
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        json.dump([entry._asdict() for entry in dataset.rows()], f, ensure_ascii=False, **layout)
     print(f"✅ Exported {len(dataset)} entries to {output_file}")
 
-def export_to_csv(dataset: List[Dict], output_file: str = 'isl-dataset.csv'):
+def export_to_csv(dataset: ActionDataset, output_file: str = 'isl-dataset.csv'):
     """Export dataset to CSV file"""
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=['word', 'sign', 'sovExample', 'category'])
-        writer.writeheader()
-        writer.writerows(dataset)
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(Entry._fields)
+        writer.writerows(dataset.rows())
     print(f"✅ Exported {len(dataset)} entries to {output_file}")
 
-def generate_typescript_dataset(dataset: List[Dict], output_file: str = 'isl-dataset.ts'):
+def generate_typescript_dataset(dataset: ActionDataset, output_file: str = 'isl-dataset.ts'):
     """Generate TypeScript file with dataset"""
-    ts_content = f"""// Auto-generated ISL Dataset
+    header = f"""// Auto-generated ISL Dataset
 // Total entries: {len(dataset)}
 // Sources: CISLR (~4,700), INCLUDE (~4,287), ISLTranslate (~31k)
 
 export const ISL_DATASET = [
 """
     
-    for entry in dataset:
-        ts_content += f"  {{ word: '{entry['word']}', sign: '{entry['sign']}', sovExample: '{entry['sovExample']}', category: '{entry['category']}' }},\n"
-    
-    ts_content += "];\n"
+    # JSON strings are valid TS string literals, so the C encoder handles all escaping
+    quote = partial(json.dumps, ensure_ascii=False)
+    body = "".join(
+        f"  {{ word: {quote(word)}, sign: {quote(sign)}, sovExample: {quote(sov_example)}, category: {quote(category)} }},\n"
+        for word, sign, sov_example, category in dataset.rows()
+    )
     
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(ts_content)
+        f.write(header)
+        f.write(body)
+        f.write("];\n")
     print(f"✅ Exported TypeScript dataset to {output_file}")
 
-def print_statistics(dataset: List[Dict]):
+def print_statistics(dataset: ActionDataset):
     """Print dataset statistics"""
     print("\n📊 Dataset Statistics:")
     print(f"Total entries: {len(dataset)}")
     
     # Count unique signs and validate
-    unique_signs = set(entry['sign'] for entry in dataset)
-    valid_signs = sum(1 for sign in unique_signs if sign.lower() in AVAILABLE_SIGNS)
+    unique_signs = set(dataset.signs)
+    valid_signs = len(unique_signs & AVAILABLE_SIGNS)
     
     print(f"Unique sign actions: {len(unique_signs)}")
     print(f"Valid .sigml files: {valid_signs}/{len(unique_signs)} ({valid_signs/len(unique_signs)*100:.1f}%)")
     
     # Count by category
-    category_counts = defaultdict(int)
-    for entry in dataset:
-        category_counts[entry['category']] += 1
+    category_counts = Counter(dataset.categories)
     
     print("\nEntries by category:")
     for category, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True):
         print(f"  {category}: {count}")
     
     # Unique words
-    unique_words = len(set(entry['word'] for entry in dataset))
+    unique_words = len(set(dataset.words))
     print(f"\nUnique words: {unique_words}")
 
 if __name__ == "__main__":
@@ -568,10 +669,15 @@ if __name__ == "__main__":
     
     print_statistics(dataset)
     
-    # Export to multiple formats
-    export_to_json(dataset, 'isl-dataset.json')
-    export_to_csv(dataset, 'isl-dataset.csv')
-    generate_typescript_dataset(dataset, 'isl-dataset.ts')
+    # Export to multiple formats; each writer only reads the dataset and owns its file
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        exports = [
+            executor.submit(export_to_json, dataset, 'isl-dataset.json'),
+            executor.submit(export_to_csv, dataset, 'isl-dataset.csv'),
+            executor.submit(generate_typescript_dataset, dataset, 'isl-dataset.ts'),
+        ]
+    for export in exports:
+        export.result()
     
     print("\n✅ Dataset generation complete!")
     print("📁 Files created:")